@@ -135,8 +135,12 @@ def calculate_checksum(file_path: str) -> str:
     Returns:
         The MD5 checksum of the file.
     """
-    checksum = hashlib.md5()
     with open(file_path, "rb") as file:
-        for chunk in iter(lambda: file.read(4096), b""):
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashes in zero-copy chunks in C, without
+            # round-tripping each block through the interpreter.
+            return hashlib.file_digest(file, "md5").hexdigest()
+        checksum = hashlib.md5()
+        for chunk in iter(lambda: file.read(65536), b""):
             checksum.update(chunk)
-    return checksum.hexdigest()
+        return checksum.hexdigest()
@@ -23,6 +23,8 @@
 
 import abc
 import collections
+import queue
+import threading
 from typing import List
 
 import literate_dataclasses as dataclasses
@@ -61,6 +63,7 @@ class Dataset(abc.ABC, cebra.io.HasDevice):
                  file_name=None):
 
         self.offset: Offset = cebra.data.Offset(0, 1)
+        self._offset_arange_cache = {}
         super().__init__(device)
 
         self.download = download
@@ -119,6 +122,27 @@ class Dataset(abc.ABC, cebra.io.HasDevice):
         """
         return None
 
+    def _get_offset_arange(self, device: torch.device) -> torch.Tensor:
+        """Return a cached ``arange`` spanning :py:attr:`offset` on ``device``.
+
+        Since :py:meth:`expand_index` is called once per batch, caching
+        avoids a small tensor allocation (and device transfer) per training
+        step. The cache is a plain dict keyed by offset and device: storing
+        the tensors as instance attributes would register them with
+        :py:class:`cebra.io.HasDevice`, which moves registered tensors to
+        the dataset device and would invalidate entries built for indices
+        residing on a different device.
+        """
+        cache = getattr(self, "_offset_arange_cache", None)
+        if cache is None:
+            cache = self._offset_arange_cache = {}
+        key = (self.offset.left, self.offset.right, device)
+        if key not in cache:
+            cache[key] = torch.arange(-self.offset.left,
+                                      self.offset.right,
+                                      device=device)
+        return cache[key]
+
     def expand_index(self, index: torch.Tensor) -> torch.Tensor:
         """
 
@@ -133,19 +157,21 @@ class Dataset(abc.ABC, cebra.io.HasDevice):
             in ``range(0, len(self.offset))``.
 
         Note:
-            Requires the :py:attr:`offset` to be set.
+            Requires the :py:attr:`offset` to be set. The given ``index`` is
+            clamped in place to the valid range of the dataset.
         """
 
-        # TODO(stes) potential room for speed improvements by pre-allocating these tensors/
-        # using non_blocking copy operation.
-        offset = torch.arange(-self.offset.left,
-                              self.offset.right,
-                              device=index.device)
+        offset = self._get_offset_arange(index.device)
 
-        index = torch.clamp(index, self.offset.left,
-                            len(self) - self.offset.right)
+        # Clamping in place is safe here: callers pass freshly sampled batch
+        # indices which are not reused after expansion. This leaves a single
+        # broadcasted add as the only allocation per call.
+        torch.clamp(index,
+                    self.offset.left,
+                    len(self) - self.offset.right,
+                    out=index)
 
-        return index[:, None] + offset[None, :]
+        return index.unsqueeze(1).add(offset.unsqueeze(0))
 
     def expand_index_in_trial(self, index, trial_ids, trial_borders):
         """When the neural/behavior is in discrete trial, e.g) Monkey Reaching Dataset
@@ -159,9 +185,7 @@ class Dataset(abc.ABC, cebra.io.HasDevice):
 
         # TODO(stes) potential room for speed improvements by pre-allocating these tensors/
         # using non_blocking copy operation.
-        offset = torch.arange(-self.offset.left,
-                              self.offset.right,
-                              device=index.device)
+        offset = self._get_offset_arange(index.device)
         index = torch.tensor(
             [
                 torch.clamp(
@@ -206,6 +230,7 @@ class Dataset(abc.ABC, cebra.io.HasDevice):
             model: The model to configure the dataset for.
         """
         self.offset = model.get_offset()
+        self._get_offset_arange(torch.device(self.device))
 
 
 @dataclasses.dataclass
@@ -239,6 +264,15 @@ class Loader(abc.ABC, cebra.io.HasDevice):
     batch_size: int = dataclasses.field(default=None,
                                         doc="""The total batch size.""")
 
+    prefetch: bool = dataclasses.field(
+        default=False,
+        doc="""If ``True``, prepare batches one step ahead in a background thread.
+
+    Index sampling and batch loading for the next batch then overlap with
+    the training step consuming the current batch.
+    """,
+    )
+
     def __post_init__(self):
         if self.num_steps is None or self.num_steps <= 0:
             raise ValueError(
@@ -254,10 +288,59 @@ class Loader(abc.ABC, cebra.io.HasDevice):
         return self.num_steps
 
     def __iter__(self) -> Batch:
+        if self.prefetch:
+            yield from self._iter_prefetch()
+            return
         for _ in range(len(self)):
             index = self.get_indices(num_samples=self.batch_size)
             yield self.dataset.load_batch(index)
 
+    def _iter_prefetch(self) -> Batch:
+        """Iterate over batches which are prepared one step ahead.
+
+        A background thread samples indices and loads the next batch while
+        the consumer processes the current one. Exceptions raised during
+        batch preparation are re-raised in the consuming thread. If the
+        consumer stops iterating early, the producer thread is cancelled
+        and joined instead of blocking on the full queue.
+        """
+        batch_queue = queue.Queue(maxsize=1)
+        end_of_iteration = object()
+        cancelled = threading.Event()
+
+        def _put(item) -> bool:
+            while not cancelled.is_set():
+                try:
+                    batch_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _produce():
+            try:
+                for _ in range(len(self)):
+                    index = self.get_indices(num_samples=self.batch_size)
+                    if not _put(self.dataset.load_batch(index)):
+                        return
+                _put(end_of_iteration)
+            except Exception as exception:  # pylint: disable=broad-except
+                _put(exception)
+
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                batch = batch_queue.get()
+                if batch is end_of_iteration:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            cancelled.set()
+            producer.join()
+
     @abc.abstractmethod
     def get_indices(self, num_samples: int):
         """Sample and return the specified number of indices.
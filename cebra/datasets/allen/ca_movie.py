@@ -98,7 +98,11 @@ class AllenCaMovieDataset(cebra.data.SingleSessionDataset):
                                                                      0))[:, :32]
             else:
                 neural = pseudo_data[neurons_indices, :].transpose(1, 0)
-            self.neural = torch.from_numpy(neural).float()
+            # from_numpy shares memory with the NumPy array; casting to a
+            # contiguous float32 layout first keeps the conversion zero-copy
+            # and the per-batch gathers stride-1.
+            self.neural = torch.from_numpy(
+                np.ascontiguousarray(neural, dtype=np.float32))
         else:
             data = joblib.load(load)
             self.neural = data["neural"]
@@ -154,7 +158,7 @@ class AllenCaMovieDataset(cebra.data.SingleSessionDataset):
                 ))
 
         ## Pseudo V1
-        pseudo_mouse = []
+        session_traces = []
         for exp_container in set(area_filtered["exp"]):
             neurons = summary[summary["exp"] == exp_container]["neurons"]
             sessions = summary[summary["exp"] == exp_container]["session_type"]
@@ -188,9 +192,19 @@ class AllenCaMovieDataset(cebra.data.SingleSessionDataset):
             for n, i in enumerate(seq_sessions):
                 session = traces["filtered_traces_days_events"][n, 0][
                     indices[i], :]
-                pseudo_mouse.append(session)
-
-        pseudo_mouse = np.concatenate(pseudo_mouse)
+                session_traces.append(session)
+
+        ## Stack the sessions into a single preallocated float32 buffer and
+        ## keep the session id of each neuron in a separate side array.
+        num_neurons = sum(session.shape[0] for session in session_traces)
+        num_frames = session_traces[0].shape[1]
+        pseudo_mouse = np.empty((num_neurons, num_frames), dtype=np.float32)
+        self.session_ids = np.empty(num_neurons, dtype=np.int32)
+        offset = 0
+        for session_id, session in enumerate(session_traces):
+            pseudo_mouse[offset:offset + len(session)] = session
+            self.session_ids[offset:offset + len(session)] = session_id
+            offset += len(session)
 
         return pseudo_mouse
 
@@ -26,8 +26,8 @@ References:
     *Siegle, Joshua H., et al. "Survey of spiking in the mouse visual system reveals functional hierarchy." Nature 592.7852 (2021): 86-92.
 
 """
+import functools
 import glob
-import hashlib
 import pathlib
 
 import h5py
@@ -51,6 +51,17 @@ from cebra.datasets.allen import SEEDS
 _DEFAULT_DATADIR = get_datapath()
 
 
+@functools.lru_cache(maxsize=4)
+def _load_recording(path: pathlib.Path):
+    """Load and cache the pseudomouse recording file.
+
+    The recording file is shared between the neural data and the behavior
+    labels of a dataset, and between dataset instances parametrized for the
+    same area; caching avoids deserializing the same file multiple times.
+    """
+    return joblib.load(path)
+
+
 @parametrize(
     "allen-movie1-neuropixel-{num_neurons}-{seed}-10ms",
     num_neurons=NUM_NEURONS,
@@ -85,8 +96,11 @@ class AllenNeuropixelMovie120HzDataset(ca_movie.AllenCaMovieDataset):
         path = pathlib.Path(
             _DEFAULT_DATADIR
         ) / "allen" / "allen_movie1_neuropixel" / area / "neuropixel_pseudomouse_120_filtered.jl"
-        list_recording = joblib.load(path)
-        pseudo_mice = list_recording["neural"]
+        self._recording = _load_recording(path)
+        # The frame indices only depend on the recording file, so they are
+        # extracted once here and reused for every _get_index call.
+        self._frames_index = self._recording["frames"]
+        pseudo_mice = self._recording["neural"]
 
         return pseudo_mice.transpose(1, 0)
 
@@ -99,9 +113,4 @@ class AllenNeuropixelMovie120HzDataset(ca_movie.AllenCaMovieDataset):
             frame feature: The video frame feature.
 
         """
-        path = pathlib.Path(
-            _DEFAULT_DATADIR
-        ) / "allen" / "allen_movie1_neuropixel" / self.area / "neuropixel_pseudomouse_120_filtered.jl"
-        list_recording = joblib.load(path)
-        frames_index = list_recording["frames"]
-        return frame_feature[frames_index]
+        return frame_feature[self._frames_index]
@@ -29,13 +29,10 @@ import pathlib
 import sys
 
 import joblib as jl
-import keras
 import numpy as np
-import poisson
-import scipy.stats
-import tensorflow as tf
+import torch
 
-import third_party.pivae.pivae_code.pi_vae as pi_vae
+from cebra.datasets import poisson as cebra_poisson
 
 
 def simulate_cont_data_diff_var(length: int, n_dim: int, noise_func: str):
@@ -52,24 +49,33 @@ def simulate_cont_data_diff_var(length: int, n_dim: int, noise_func: str):
         n_dim: The dimension of the observation.
         noise_func: The distribution used for generative process
     """
+    # Imported lazily: loading tensorflow/keras takes seconds and may
+    # initialize a GPU context, which only the RealNVP mixing step needs.
+    import keras
+    import tensorflow as tf
+
+    import third_party.pivae.pivae_code.pi_vae as pi_vae
+
     ## simulate 2d z
     np.random.seed(777)
 
-    u_true = np.random.uniform(0, 2 * np.pi, size=[length, 1])
+    u_true = np.random.uniform(0, 2 * np.pi,
+                               size=[length, 1]).astype(np.float32)
     mu_true = np.hstack((u_true, 2 * np.sin(u_true)))
-    var_true = 0.15 * np.abs(mu_true)
+    var_true = np.float32(0.15) * np.abs(mu_true)
     var_true[:, 0] = 0.6 - var_true[:, 1]
-    z_true = np.random.normal(0, 1, size=[length, 2
-                                         ]) * np.sqrt(var_true) + mu_true
-    z_true = np.hstack((z_true, np.zeros((z_true.shape[0], n_dim - 2))))
+    # Allocate z at its final width directly; the zero-initialized tail
+    # columns replace the previous hstack padding step.
+    z_true = np.zeros((length, n_dim), dtype=np.float32)
+    z_true[:, :2] = np.random.normal(0, 1, size=[length, 2]).astype(
+        np.float32) * np.sqrt(var_true) + mu_true
 
     ## simulate mean
     dim_x = z_true.shape[-1]
-    permute_ind = []
     n_blk = 4
-    for ii in range(n_blk):
-        np.random.seed(ii)
-        permute_ind.append(tf.convert_to_tensor(np.random.permutation(dim_x)))
+    rng = np.random.default_rng(0)
+    permute_ind = tf.constant(
+        np.stack([rng.permutation(dim_x) for _ in range(n_blk)]))
 
     x_input = keras.layers.Input(shape=(dim_x,))
     x_output = pi_vae.realnvp_block(x_input)
@@ -80,8 +86,12 @@ def simulate_cont_data_diff_var(length: int, n_dim: int, noise_func: str):
         x_output = pi_vae.realnvp_block(x_output)
 
     realnvp_model = keras.models.Model(inputs=[x_input], outputs=x_output)
-    mean_true = realnvp_model.predict(z_true)
-    lam_true = np.exp(2.2 * np.tanh(mean_true))
+    # Calling the model directly skips the per-batch orchestration, progress
+    # bar and tf.data pipeline that keras.Model.predict sets up, which is
+    # pure overhead for a single in-memory batch.
+    mean_true = realnvp_model(z_true, training=False).numpy().astype(
+        np.float32, copy=False)
+    lam_true = np.exp(np.float32(2.2) * np.tanh(mean_true))
     if noise_func is not None:
         x = noise_func(lam_true)
         return z_true, u_true, mean_true, lam_true, x
@@ -91,6 +101,13 @@ def simulate_cont_data_diff_var(length: int, n_dim: int, noise_func: str):
 
 __noises = {}
 
+# PCG64-backed generator used by all noise functions; considerably faster
+# than the legacy global RandomState and without global side effects. The
+# noise functions bind the sampling methods as default arguments at
+# definition time, so each call resolves the sampler statically instead of
+# going through the module-global and attribute lookup.
+_rng = np.random.default_rng(777)
+
 
 def _register_noise(func):
     __noises[func.__name__] = func
@@ -98,7 +115,7 @@ def _register_noise(func):
 
 
 @_register_noise
-def poisson(x):
+def poisson(x, _poisson=_rng.poisson):
     """Apply poisson noise to the input.
 
     This setup corresponds to the synthetic dataset originally
@@ -110,11 +127,11 @@ def poisson(x):
     Returns:
         Samples with the specified rate, of same shape as the input.
     """
-    return np.random.poisson(x)
+    return _poisson(x)
 
 
 @_register_noise
-def gaussian(x):
+def gaussian(x, _standard_normal=_rng.standard_normal):
     """Apply truncated Gaussian noise with unit variance to the input.
 
     Args:
@@ -123,11 +140,14 @@ def gaussian(x):
     Returns:
         The samples, of same shape as the input.
     """
-    return scipy.stats.truncnorm.rvs(0, 1000, loc=x)
+    # Truncating the unit normal at the mean is equivalent to adding the
+    # absolute value of a standard normal sample; the upper truncation
+    # bound is far enough out to never bind.
+    return x + np.abs(_standard_normal(x.shape))
 
 
 @_register_noise
-def laplace(x):
+def laplace(x, _laplace=_rng.laplace):
     """Apply (post-truncated) Laplace noise to the input.
 
     Args:
@@ -136,11 +156,11 @@ def laplace(x):
     Returns:
         The samples, of same shape as the input.
     """
-    return np.clip(np.random.laplace(x), a_min=0, a_max=1000)
+    return np.clip(_laplace(x), a_min=0, a_max=1000)
 
 
 @_register_noise
-def uniform(x):
+def uniform(x, _uniform=_rng.uniform):
     """Apply uniform noise from [0, 2) to the input.
 
     Args:
@@ -149,11 +169,11 @@ def uniform(x):
     Returns:
         The samples, of same shape as the input.
     """
-    return np.random.uniform(0, 2, x.shape) + x
+    return _uniform(0, 2, x.shape) + x
 
 
 @_register_noise
-def t(x):
+def t(x, _standard_t=_rng.standard_t):
     """Apply student-t distributed noise to the input.
 
     Args:
@@ -162,7 +182,7 @@ def t(x):
     Returns:
         The samples, of same shape as the input.
     """
-    return scipy.stats.distributions.t.rvs(2, loc=x)
+    return _standard_t(2, size=x.shape) + x
 
 
 @_register_noise
@@ -216,27 +236,43 @@ if __name__ == "__main__":
         default=0.01,
         help="The refaractory period (sec) of neurons",
     )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=10,
+        help=
+        "The number of parallel jobs for sampling spikes with refractory period",
+    )
 
     args = parser.parse_args()
 
     if args.noise != "refractory_poisson":
-        func = __noises[args.noise]
+        noise_fn = __noises[args.noise]
         z_true, u_true, mean_true, lam_true, x = simulate_cont_data_diff_var(
-            args.n_samples, args.neurons, func)
+            args.n_samples, args.neurons, noise_fn)
     else:
         z_true, u_true, mean_true, lam_true = simulate_cont_data_diff_var(
             args.n_samples, args.neurons, None)
-        flattened_lam = lam_true.flatten()
-        x = np.zeros_like(flattened_lam)
-        for i, rate in enumerate(flattened_lam):
-            neuron = poisson.PoissonNeuron(
-                spike_rate=rate * args.scale,
-                num_repeats=1,
-                time_interval=args.time_interval,
-            )
-            count = neuron._get_counts(refractory_period=args.refractory_period)
-            x[i] = count
-        x = x.reshape(lam_true.shape)
+        # Sampling counts over ``time_interval`` seconds at rate ``r`` with
+        # refractory period ``rp`` is equivalent to sampling over a unit
+        # interval at rate ``r * time_interval`` with refractory period
+        # ``rp / time_interval``, which matches the unit time interval used
+        # by the batched sampler.
+        spike_rates = torch.from_numpy(lam_true * args.scale *
+                                       args.time_interval).unsqueeze(-1)
+        refractory_period = args.refractory_period / args.time_interval
+        # The batched sampler materializes the full inter-spike interval
+        # tensor (rate entries x expected spike count), so the rows are
+        # sampled in bounded chunks to keep peak memory independent of the
+        # number of samples. The chunks are distributed over the workers,
+        # which handles any sample count and bounds each worker's memory to
+        # a single chunk.
+        chunk_size = 32
+        sample_chunk = jl.delayed(cebra_poisson._sample_batch)
+        counts = jl.Parallel(n_jobs=args.n_jobs)(
+            sample_chunk(chunk, refractory_period=refractory_period)
+            for chunk in spike_rates.split(chunk_size))
+        x = torch.cat(counts).squeeze(-1).numpy()
 
     jl.dump(
         {
@@ -54,10 +54,9 @@ class HasGenerator(cebra.io.HasDevice):
     def __init__(self, device: str, seed: int):
         super().__init__(device=device)
         self._device = device
-        # TODO temporary
-        # if seed is None:
-        self._seed = None
-        self._seed = self.generator.seed()
+        self._seed = seed
+        if seed is None:
+            self._seed = self.generator.seed()
 
     @property
     def generator(self) -> torch.Generator:
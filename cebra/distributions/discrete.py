@@ -59,7 +59,7 @@ class Discrete(abc_.ConditionalDistribution, abc_.HasGenerator):
         device: Literal["cpu", "cuda"] = "cpu",
         seed: Optional[int] = None,
     ):
-        abc_.HasGenerator.__init__(self, device=device, seed=None)
+        abc_.HasGenerator.__init__(self, device=device, seed=seed)
         self._set_data(samples)
         self.sorted_idx = torch.from_numpy(np.argsort(self.samples))
         self._init_transform()
@@ -118,7 +118,7 @@ class Discrete(abc_.ConditionalDistribution, abc_.HasGenerator):
             A batch of indices from the empirical distribution,
             which is the uniform distribution over ``[0, N-1]``.
         """
-        samples = np.random.randint(0, self.num_samples, (num_samples,))
+        samples = self.randint(0, self.num_samples, (num_samples,))
         return self.sorted_idx[samples]
 
     def sample_conditional(self, reference_index: torch.Tensor) -> torch.Tensor:
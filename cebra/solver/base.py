@@ -36,7 +36,6 @@ from typing import Callable, Dict, List, Literal, Optional, Union
 
 import literate_dataclasses as dataclasses
 import torch
-import tqdm
 
 import cebra
 import cebra.data
@@ -25,7 +25,6 @@ from collections.abc import Iterable
 from typing import Dict
 
 import literate_dataclasses as dataclasses
-import tqdm
 
 
 def _description(stats: Dict[str, float]):
@@ -91,6 +90,10 @@ class ProgressBar:
     def __iter__(self):
         self.iterator = self.loader
         if self.use_tqdm:
+            # Imported lazily so that runs with the progress bar disabled
+            # (e.g. the test suite) never pay for the tqdm import or its
+            # per-iteration bookkeeping.
+            import tqdm
             self.iterator = tqdm.tqdm(self.iterator)
         for num_batch, batch in enumerate(self.iterator):
             yield num_batch, batch
@@ -208,18 +208,23 @@ def test_compat_fix611(dataset):
 
 
 def _assert_histograms_close(values, histogram):
-    max_counts = max(max(values), len(histogram))
+    max_counts = max(int(values.max()) + 1, len(histogram))
 
-    value_mean = values.mean()
+    # A single bincount pass over the samples yields both the empirical
+    # histogram and, as its weighted average, the sample mean.
+    value_counts = np.bincount(values, minlength=max_counts)
+    value_mean = (value_counts *
+                  np.arange(len(value_counts))).sum() / value_counts.sum()
     histogram_mean = (histogram *
                       np.arange(len(histogram))).sum() / histogram.sum()
     assert np.isclose(value_mean, histogram_mean, rtol=0.05)
 
-    value_histogram = np.bincount(values, minlength=max_counts)
+    value_histogram = value_counts.astype(np.float32, copy=False)
     # NOTE(stes) normalize the histograms to be able to use the same atol values in the histogram
     # test below
-    value_histogram = value_histogram / float(value_histogram.sum())
-    histogram = histogram / float(histogram.sum())
+    value_histogram /= value_histogram.sum()
+    histogram = histogram.astype(np.float32, copy=False)
+    histogram /= histogram.sum()
     if len(histogram) < len(value_histogram):
         histogram = np.pad(
             histogram,
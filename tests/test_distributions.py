@@ -214,7 +214,7 @@ def test_discrete_uniform_discrete():
     N = 10000
     probs = [0.3, 0.1, 0.6]
     samples = np.random.choice([0, 1, 2], p=probs, size=(N,))
-    dist = cebra_distr.Discrete(samples)
+    dist = cebra_distr.Discrete(samples, seed=0)
     resample_uni = samples[dist.sample_uniform(N)]
     resample_emp = samples[dist.sample_empirical(N)]
 
@@ -226,8 +226,12 @@ def test_discrete_uniform_discrete():
         np.bincount(samples) / N, np.array([0.3055, 0.0974, 0.5971]))
     assert np.allclose(
         np.bincount(resample_uni) / N, np.array([0.3424, 0.3278, 0.3298]))
-    assert np.allclose(
-        np.bincount(resample_emp) / N, np.array([0.2969, 0.098, 0.6051]))
+    # NOTE: the empirical samples are drawn with the distribution's torch
+    # generator, so check the frequencies statistically against the label
+    # distribution instead of pinning values produced by the NumPy RNG.
+    assert np.allclose(np.bincount(resample_emp) / N,
+                       np.bincount(samples) / N,
+                       atol=0.02)
 
 
 @pytest.mark.parametrize("time_offset", [1, 5, 10])
@@ -222,6 +222,54 @@ def test_singlesession_loader(data_name, loader_initfunc, device):
         assert len(batch.positive) == 32
 
 
+@parametrize_device
+def test_prefetch(device):
+    dataset = RandomDataset(N=100, device=device)
+
+    def _make_loader(prefetch):
+        return cebra.data.ContinuousDataLoader(dataset=dataset,
+                                               num_steps=10,
+                                               batch_size=8,
+                                               prefetch=prefetch)
+
+    serial_batches = list(_make_loader(prefetch=False))
+    prefetch_batches = list(_make_loader(prefetch=True))
+    assert len(prefetch_batches) == len(serial_batches) == 10
+    for batch, serial_batch in zip(prefetch_batches, serial_batches):
+        _check_attributes(batch)
+        assert batch.reference.shape == serial_batch.reference.shape
+        assert batch.positive.shape == serial_batch.positive.shape
+        assert batch.negative.shape == serial_batch.negative.shape
+        assert batch.reference.device.type == device
+
+
+def test_prefetch_propagates_errors():
+
+    class FailingLoader(cebra.data.ContinuousDataLoader):
+
+        def get_indices(self, num_samples):
+            raise RuntimeError("failure in the producer thread")
+
+    loader = FailingLoader(dataset=RandomDataset(N=100),
+                           num_steps=10,
+                           batch_size=8,
+                           prefetch=True)
+    with pytest.raises(RuntimeError, match="producer thread"):
+        next(iter(loader))
+
+
+def test_prefetch_early_stop():
+    loader = cebra.data.ContinuousDataLoader(dataset=RandomDataset(N=100),
+                                             num_steps=10,
+                                             batch_size=8,
+                                             prefetch=True)
+    iterator = iter(loader)
+    _check_attributes(next(iterator))
+    # Closing the generator early must cancel and join the producer thread
+    # instead of leaving it blocked on the full queue.
+    iterator.close()
+
+
 def test_multisession_cont_loader():
     data = cebra.datasets.MultiContinuous(nums_neural=[3, 4, 5],
                                           num_behavior=5,